@@ -1,22 +1,124 @@
 """Graph nodes for the job-search orchestrator."""
 
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import hashlib
 import logging
+import os
+import time
 
-from langchain_community.document_loaders import PyPDFLoader
-from langchain_google_genai import ChatGoogleGenerativeAI
+from langchain_core.exceptions import OutputParserException
+from pydantic import BaseModel, ValidationError
 
 from src.agents.state import AgentState
-from src.chains.prompts import PROFILE_EXTRACTION_PROMPT, QUERY_GENERATION_PROMPT
+from src.chains.prompts import (
+    PROFILE_EXTRACTION_PROMPT,
+    PROMPT_VERSION,
+    QUERY_GENERATION_PROMPT,
+)
 from src.schema.profile import CandidateProfile
 from src.schema.search import SearchQueryList
 from src.schema.job import JobListing
 from src.tools.linkedin_scraper import LinkedInScraper
+from src.utils import llm_cache
 from src.utils.storage import JobDatabase
 
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+MODEL_NAME = "gemini-2.5-flash"
+MAX_LLM_ATTEMPTS = 3
+RESUME_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "job-orch", "pdf")
+
+
+@functools.lru_cache(maxsize=8)
+def _get_structured(model: str, schema: type[BaseModel]):
+    """Return a Gemini client bound to schema, built once per (model, schema)."""
+    # Imported lazily: the Google client stack is slow to import and is not
+    # needed to build the graph.
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    return ChatGoogleGenerativeAI(model=model).with_structured_output(schema)
+
+
+def _invoke_cached(schema: type[BaseModel], prompt: str) -> BaseModel | None:
+    """
+    Invoke Gemini with structured output, reusing on-disk cached responses.
+    Returns None, uncached, when the model produces no structured output.
+    """
+    key = llm_cache.make_key(PROMPT_VERSION, MODEL_NAME, prompt)
+    cached = llm_cache.get(key)
+    if cached is not None:
+        try:
+            result = schema.model_validate(cached)
+        except ValidationError:
+            # Stale entry written against an older version of the schema.
+            logger.debug(f"Discarding stale LLM cache entry for {schema.__name__}")
+        else:
+            logger.debug(f"LLM cache hit for {schema.__name__}")
+            return result
+
+    structured_llm = _get_structured(MODEL_NAME, schema)
+    attempt_prompt = prompt
+    for attempt in range(MAX_LLM_ATTEMPTS):
+        try:
+            result = structured_llm.invoke(attempt_prompt)
+            break
+        except (ValidationError, OutputParserException) as e:
+            if attempt == MAX_LLM_ATTEMPTS - 1:
+                raise
+            logger.warning(
+                f"Invalid {schema.__name__} output (attempt {attempt + 1}): {e}"
+            )
+            # Feed the error back so the model can correct its output.
+            attempt_prompt = (
+                f"{prompt}\n\nYour previous output had error: {e}. Fix and retry."
+            )
+            time.sleep(1.0 * (attempt + 1))
+
+    if result is not None:
+        llm_cache.put(key, result)
+    return result
+
+
+@functools.lru_cache(maxsize=1)
+def _get_scraper() -> LinkedInScraper:
+    """Return the process-wide scraper so its connections are reused across calls."""
+    return LinkedInScraper()
+
+
+def _load_resume_text(resume_path: str) -> str:
+    """
+    Extract plain text from every page of a PDF resume. Results are cached on
+    disk by the SHA-256 of the file so unchanged resumes are parsed only once.
+    """
+    with open(resume_path, "rb") as f:
+        pdf_bytes = f.read()
+    cache_path = os.path.join(
+        RESUME_CACHE_DIR, f"{hashlib.sha256(pdf_bytes).hexdigest()}.txt"
+    )
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        pass
+
+    import pymupdf
+
+    # PyMuPDF documents are not thread-safe, so pages are read sequentially;
+    # the C-backed extraction is fast enough for resume-sized files.
+    with pymupdf.open(stream=pdf_bytes, filetype="pdf") as doc:
+        resume_text = "\n\n".join(page.get_text() for page in doc)
+
+    os.makedirs(RESUME_CACHE_DIR, exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(resume_text)
+    os.replace(tmp_path, cache_path)
+    return resume_text
+
+
 def profile_encoder_node(state: AgentState) -> dict:
     """
     Load resume from PDF, merge with user_prompt, and extract a structured
@@ -24,12 +126,12 @@ def profile_encoder_node(state: AgentState) -> dict:
     """
     resume_path = state.get("resume_path") or ""
     user_prompt = state.get("user_prompt") or ""
+    if not resume_path and not user_prompt:
+        return {"profile": CandidateProfile()}
 
     resume_text = ""
     if resume_path:
-        loader = PyPDFLoader(resume_path)
-        docs = loader.load()
-        resume_text = "\n\n".join(doc.page_content for doc in docs)
+        resume_text = _load_resume_text(resume_path)
 
     logger.debug(f"Resume text: {resume_text}")
 
@@ -38,9 +140,7 @@ def profile_encoder_node(state: AgentState) -> dict:
         user_prompt=user_prompt or "(No additional preferences.)",
     )
 
-    model = ChatGoogleGenerativeAI(model="gemini-2.5-flash")
-    structured_llm = model.with_structured_output(CandidateProfile)
-    profile = structured_llm.invoke(prompt)
+    profile = _invoke_cached(CandidateProfile, prompt)
 
     logger.debug(f"Profile: {profile}")
 
@@ -53,7 +153,7 @@ def query_optimizer_node(state: AgentState) -> dict:
     using Gemini 2.5. Combines job titles, location preferences, and keywords.
     """
     profile = state.get("profile")
-    if not profile:
+    if not profile or profile == CandidateProfile():
         return {"search_queries": []}
 
     prompt = QUERY_GENERATION_PROMPT.format(
@@ -66,9 +166,7 @@ def query_optimizer_node(state: AgentState) -> dict:
 
     logger.debug(f"Prompt: {prompt}")
 
-    model = ChatGoogleGenerativeAI(model="gemini-2.5-flash")
-    structured_llm = model.with_structured_output(SearchQueryList)
-    result = structured_llm.invoke(prompt)
+    result = _invoke_cached(SearchQueryList, prompt)
 
     logger.debug(f"Result: {result}")
 
@@ -90,34 +188,34 @@ def job_discovery_node(state: AgentState) -> dict:
     remote_filters = state.get("remote_filters") or []
     remote_value = remote_filters[0] if len(remote_filters) == 1 else ""
 
-    db = JobDatabase(remote=remote_value)
-    scraper = LinkedInScraper()
+    scraper = _get_scraper()
 
-    found_jobs: list[JobListing] = []
-    seen_urls: set[str] = set()
-
-    for query in search_queries:
-        jobs = scraper.search_jobs(
+    def search(query: str) -> list[JobListing]:
+        return scraper.search_jobs(
             query=query,
             location=location,
             job_type=job_type_filters or None,
             experience_level=experience_level_filters or None,
             remote=remote_filters or None,
         )
-        if not jobs:
-            continue
-
-        urls = [job.job_url for job in jobs if job.job_url]
-        new_urls = set(db.get_new_jobs(urls))
-        filtered_jobs = [job for job in jobs if job.job_url in new_urls]
-        if filtered_jobs:
-            db.add_jobs(filtered_jobs)
-
-        for job in filtered_jobs:
-            if job.job_url in seen_urls:
-                continue
-            seen_urls.add(job.job_url)
-            found_jobs.append(job)
+
+    # Scrapes are network-bound, so run them concurrently. The scraper's HTTP
+    # client is thread-safe and browser fallbacks are serialized by the browser
+    # pool, so one instance can be shared; DB access stays on this thread.
+    with ThreadPoolExecutor(max_workers=len(search_queries)) as executor:
+        results = list(executor.map(search, search_queries))
+
+    # Deduplicate across all queries in memory, then hit the DB once.
+    by_url: dict[str, JobListing] = {}
+    for jobs in results:
+        for job in jobs:
+            if job.job_url:
+                by_url.setdefault(job.job_url, job)
+
+    with JobDatabase(remote=remote_value) as db:
+        found_jobs = [by_url[url] for url in db.get_new_jobs(list(by_url))]
+        if found_jobs:
+            db.add_jobs(found_jobs)
 
     return {"found_jobs": found_jobs}
 
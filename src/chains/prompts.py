@@ -1,5 +1,8 @@
 """Prompt templates for the job-search orchestrator."""
 
+# Bump whenever a template changes so cached LLM responses are invalidated.
+PROMPT_VERSION = "v1"
+
 PROFILE_EXTRACTION_PROMPT = """You are extracting a structured candidate profile for job matching.
 
 Resume text:
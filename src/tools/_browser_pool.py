@@ -0,0 +1,109 @@
+"""Process-wide headless browser shared by the LinkedIn scraper."""
+
+from __future__ import annotations
+
+import atexit
+from concurrent.futures import Future
+import os
+import queue
+import threading
+from typing import Callable, TypeVar
+
+from playwright.sync_api import BrowserContext, Page, Playwright
+from playwright.sync_api import sync_playwright
+
+
+T = TypeVar("T")
+
+# Cookies, cache and HSTS entries persist here across runs.
+PROFILE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "linkedin-scraper")
+
+CONTEXT_HEADERS = {
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+
+class _BrowserPool:
+    """
+    Lazily launches one persistent-profile Firefox context and hands out pages.
+
+    Playwright's sync API binds its objects to the thread that created them, so
+    the browser lives on a single dedicated thread and callers from any thread
+    submit work to it through run().
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._tasks: queue.Queue = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._playwright: Playwright | None = None
+        self._context: BrowserContext | None = None
+
+    def run(self, fn: Callable[[Page], T]) -> T:
+        """Call fn with a new page and return its result."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._worker, name="browser-pool", daemon=True
+                )
+                self._thread.start()
+            future: Future = Future()
+            self._tasks.put((fn, future))
+        return future.result()
+
+    def shutdown(self) -> None:
+        """Close the browser and stop the worker thread, if they were started."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is None:
+                return
+            future: Future = Future()
+            self._tasks.put((None, future))
+        future.result()
+        thread.join()
+
+    def _worker(self) -> None:
+        while True:
+            fn, future = self._tasks.get()
+            if fn is None:
+                self._close()
+                future.set_result(None)
+                return
+            try:
+                future.set_result(self._run_on_page(fn))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def _run_on_page(self, fn: Callable[[Page], T]) -> T:
+        if self._context is None:
+            self._close()
+            self._playwright = sync_playwright().start()
+            self._context = self._playwright.firefox.launch_persistent_context(
+                PROFILE_DIR,
+                headless=True,
+                extra_http_headers=CONTEXT_HEADERS,
+            )
+            self._context.on("close", self._on_context_closed)
+        page = self._context.new_page()
+        try:
+            return fn(page)
+        finally:
+            page.close()
+
+    def _on_context_closed(self, _context: BrowserContext) -> None:
+        self._context = None
+
+    def _close(self) -> None:
+        if self._context is not None:
+            try:
+                self._context.close()
+            except Exception:
+                pass  # Browser already gone
+            self._context = None
+        if self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
+
+
+pool = _BrowserPool()
+atexit.register(pool.shutdown)
@@ -3,18 +3,73 @@
 from __future__ import annotations
 
 from datetime import date, datetime
+import functools
 import hashlib
+import logging
 import os
+import re
 from typing import List
 from urllib.parse import quote_plus, urlencode, urlsplit
 
+import httpx
+import lxml.html
+from playwright.sync_api import Page, Route
 from playwright.sync_api import Error as PlaywrightError
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
-from playwright.sync_api import sync_playwright
 
 from src.schema.job import JobListing
+from src.tools._browser_pool import pool
 
 
+logger = logging.getLogger(__name__)
+
+GUEST_SEARCH_URL = (
+    "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+)
+# Cards per guest API page; a shorter first page means there are no more.
+GUEST_PAGE_SIZE = 10
+HTTP_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64; rv:128.0) Gecko/20100101 Firefox/128.0"
+    ),
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# Nothing visual is read from the page, so skip downloading it.
+BLOCKED_RESOURCE_TYPES = {"image", "font", "stylesheet", "media"}
+BLOCKED_DOMAINS = ("doubleclick.net", "googletagmanager.com", "google-analytics.com")
+
+# Reads every job card on the search page in a single page.evaluate call,
+# returning the same raw dicts as the HTTP path.
+EXTRACT_CARDS_JS = """
+([selector, fallbackSelector, limit]) => {
+    let cards = Array.from(document.querySelectorAll(selector));
+    if (!cards.length) {
+        cards = Array.from(document.querySelectorAll(fallbackSelector));
+    }
+    const text = (el, sel) => el.querySelector(sel)?.innerText.trim() || null;
+    return cards.slice(0, limit).map((card) => {
+        const time = card.querySelector(
+            "time.job-search-card__listdate, time.job-search-card__listdate--new"
+        );
+        return {
+            title: text(card, "h3.base-search-card__title"),
+            company: text(
+                card,
+                "h4.base-search-card__subtitle a, h4.base-search-card__subtitle"
+            ),
+            location: text(card, "span.job-search-card__location"),
+            href: card.querySelector("a.base-card__full-link")?.getAttribute("href") || null,
+            posted: time?.getAttribute("datetime") || time?.innerText.trim() || null,
+            description: text(
+                card,
+                "p.job-search-card__snippet, div.base-search-card__metadata p"
+            ),
+        };
+    });
+}
+"""
+
 JOB_TYPE_MAP = {
     "full-time": "F",
     "part-time": "P",
@@ -36,22 +91,136 @@ REMOTE_MAP = {
 }
 
 
-def _normalize(values: List[str] | None) -> List[str]:
+_URL_RE = re.compile(r"^(https?://[^/?#]+[^?#]*)")
+
+
+def _filter_codes(values: List[str] | None, codes: dict[str, str]) -> List[str]:
+    """Normalize filter values and map them to LinkedIn codes in one pass."""
     if not values:
         return []
-    return [v.strip().lower() for v in values if v and v.strip()]
+    return [
+        code
+        for code in (codes.get(v.strip().lower()) for v in values if v)
+        if code is not None
+    ]
 
 
+@functools.lru_cache(maxsize=4096)
 def _canonicalize_job_url(url: str) -> str:
     """Strip query params and fragments for stable job URLs."""
-    parts = urlsplit(url)
-    if not parts.scheme or not parts.netloc:
-        return url
-    return f"{parts.scheme}://{parts.netloc}{parts.path}"
+    match = _URL_RE.match(url)
+    return match.group(1) if match else url
+
+
+def _block_heavy_resources(route: Route) -> None:
+    """Abort requests for assets and trackers the scraper never reads."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+        domain in urlsplit(request.url).netloc for domain in BLOCKED_DOMAINS
+    ):
+        route.abort()
+    else:
+        route.continue_()
+
+
+def _class_xpath(tag: str, cls: str) -> str:
+    """XPath matching tag elements whose class list contains cls."""
+    return (
+        f"{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')]"
+    )
+
+
+def _first_text(node, xpath: str) -> str | None:
+    matches = node.xpath(xpath)
+    if not matches:
+        return None
+    return matches[0].text_content().strip() or None
+
+
+def _parse_cards_html(html: str) -> List[dict]:
+    """Parse job-card fragments returned by the guest jobs API into raw dicts."""
+    if not html.strip():
+        return []
+    tree = lxml.html.fromstring(f"<ul>{html}</ul>")
+    raw_cards = []
+    for card in tree.xpath(f"//li[.//{_class_xpath('h3', 'base-search-card__title')}]"):
+        hrefs = card.xpath(f".//{_class_xpath('a', 'base-card__full-link')}/@href")
+        posted = card.xpath(".//time/@datetime")
+        raw_cards.append(
+            {
+                "title": _first_text(
+                    card, f".//{_class_xpath('h3', 'base-search-card__title')}"
+                ),
+                "company": _first_text(
+                    card, f".//{_class_xpath('h4', 'base-search-card__subtitle')}"
+                ),
+                "location": _first_text(
+                    card, f".//{_class_xpath('span', 'job-search-card__location')}"
+                ),
+                "href": hrefs[0].strip() if hrefs else None,
+                "posted": posted[0] if posted else _first_text(card, ".//time"),
+                "description": _first_text(
+                    card,
+                    f".//{_class_xpath('p', 'job-search-card__snippet')}"
+                    f" | .//{_class_xpath('div', 'base-search-card__metadata')}//p",
+                ),
+            }
+        )
+    return raw_cards
+
+
+def _parse_posted(posted_raw: str | None) -> date | None:
+    """Parse a card's posted date, taking a fast path for plain YYYY-MM-DD."""
+    if not posted_raw:
+        return None
+    if len(posted_raw) == 10 and posted_raw[4] == "-" and posted_raw[7] == "-":
+        try:
+            return date(
+                int(posted_raw[:4]), int(posted_raw[5:7]), int(posted_raw[8:10])
+            )
+        except ValueError:
+            pass
+    try:
+        return datetime.fromisoformat(posted_raw.replace("Z", "+00:00")).date()
+    except ValueError:
+        return None
+
+
+def _build_listing(raw: dict) -> JobListing | None:
+    """Turn a raw card dict into a JobListing, or None if it has no link."""
+    job_url = raw.get("href")
+    if not job_url:
+        return None
+    canonical_url = _canonicalize_job_url(job_url)
+    job_id = hashlib.blake2b(
+        canonical_url.encode("utf-8"), digest_size=16
+    ).hexdigest()
+
+    return JobListing(
+        id=job_id,
+        title=raw.get("title"),
+        company=raw.get("company"),
+        job_url=canonical_url,
+        location=raw.get("location"),
+        description=raw.get("description"),
+        date_posted=_parse_posted(raw.get("posted")),
+    )
 
 
 class LinkedInScraper:
-    """Scrape LinkedIn job search results using Playwright."""
+    """
+    Scrape LinkedIn job search results. Cards are fetched over plain HTTP from
+    the guest jobs API, falling back to a headless browser when that fails.
+    """
+
+    def __init__(self) -> None:
+        # httpx.Client is thread-safe and keeps connections alive across calls.
+        self._client = httpx.Client(
+            http2=True,
+            headers=HTTP_HEADERS,
+            timeout=30.0,
+            follow_redirects=True,
+        )
 
     def search_jobs(
         self,
@@ -64,17 +233,9 @@ class LinkedInScraper:
         wait_ms: int = 20000,
     ) -> List[JobListing]:
         """Search LinkedIn jobs for the given query and return JobListing objects."""
-        job_type_codes = [
-            JOB_TYPE_MAP[v] for v in _normalize(job_type) if v in JOB_TYPE_MAP
-        ]
-        experience_codes = [
-            EXPERIENCE_LEVEL_MAP[v]
-            for v in _normalize(experience_level)
-            if v in EXPERIENCE_LEVEL_MAP
-        ]
-        remote_codes = [
-            REMOTE_MAP[v] for v in _normalize(remote) if v in REMOTE_MAP
-        ]
+        job_type_codes = _filter_codes(job_type, JOB_TYPE_MAP)
+        experience_codes = _filter_codes(experience_level, EXPERIENCE_LEVEL_MAP)
+        remote_codes = _filter_codes(remote, REMOTE_MAP)
 
         params = {
             "keywords": query,
@@ -87,131 +248,117 @@ class LinkedInScraper:
         if remote_codes:
             params["f_WT"] = ",".join(remote_codes)
 
-        search_url = "https://www.linkedin.com/jobs/search?" + urlencode(
-            params, quote_via=quote_plus
-        )
+        raw_cards = self._fetch_cards_http(params, limit)
+        if not raw_cards:
+            search_url = "https://www.linkedin.com/jobs/search?" + urlencode(
+                params, quote_via=quote_plus
+            )
+            raw_cards = self._fetch_cards_browser(search_url, limit, wait_ms)
 
         results: List[JobListing] = []
+        for raw in raw_cards[:limit]:
+            listing = _build_listing(raw)
+            if listing is not None:
+                results.append(listing)
+        logger.info(f"Scraped {len(results)}/{limit} jobs for query {query!r}")
+        return results
 
-        with sync_playwright() as p:
-            browser = p.firefox.launch(headless=True)
-            page = browser.new_page()
-            page.set_extra_http_headers({
-                "Accept-Language": "en-US,en;q=0.9",
-            })
-
-            try:
-                page.goto(search_url, wait_until="domcontentloaded", timeout=30000)
-            except (PlaywrightTimeoutError, PlaywrightError) as e:
-                print(f"Navigation failed: {e}")
-                browser.close()
-                return results
-
-            # Handle "Sign in to view more jobs" modal if it appears
-            try:
-                modal_close_btn = page.locator("button.modal__dismiss")
-                if modal_close_btn.is_visible(timeout=5000):
-                    modal_close_btn.click()
-                    page.wait_for_timeout(1000)  # Wait for modal to fade
-            except Exception:
-                pass  # Modal didn't appear or couldn't be closed
-
-            try:
-                page.wait_for_selector(
-                    "ul.jobs-search__results-list > li", timeout=wait_ms
-                )
-                cards = page.query_selector_all("ul.jobs-search__results-list > li")
-                print(f"Found {len(cards)} cards")
-                if not cards:
-                    cards = page.query_selector_all("div.base-card")
-            except PlaywrightError as e:
-                print(f"Error waiting for job cards: {e}")
-                browser.close()
-                return results
-
-            if not cards:
-                try:
-                    path = os.path.abspath("linkedin_scraper_debug.png")
-                    page.screenshot(path=path)
-                    print(f"No job cards found. Screenshot saved to: {path}")
-                except Exception as e:
-                    print(f"Error saving screenshot: {e}")
-                    pass
-
+    def _fetch_cards_http(self, params: dict, limit: int) -> List[dict]:
+        """Fetch up to limit cards from the guest jobs API."""
+        raw_cards = self._fetch_page(params, 0)
+        page_size = len(raw_cards)
+        if page_size < GUEST_PAGE_SIZE:
+            return raw_cards
+
+        # Pages are fetched one after another: discovery already runs queries
+        # concurrently, and the guest API rate-limits hard. A short or failed
+        # page marks the end, so no later page is requested past a gap.
+        while len(raw_cards) < limit:
+            page_cards = self._fetch_page(params, len(raw_cards))
+            raw_cards.extend(page_cards)
+            if len(page_cards) < page_size:
+                break
+        return raw_cards
+
+    def _fetch_page(self, params: dict, start: int) -> List[dict]:
+        """Fetch one page of cards; returns [] on any HTTP failure."""
+        try:
+            response = self._client.get(
+                GUEST_SEARCH_URL, params={**params, "start": start}
+            )
+        except httpx.HTTPError as e:
+            logger.warning(f"Guest API request failed: {e}")
+            return []
+        if response.status_code != 200:
+            logger.warning(f"Guest API returned HTTP {response.status_code}")
+            return []
+        return _parse_cards_html(response.text)
+
+    def _fetch_cards_browser(
+        self, search_url: str, limit: int, wait_ms: int
+    ) -> List[dict]:
+        """Render the public search page in the shared browser and read its job cards."""
+        try:
+            return pool.run(
+                lambda page: self._read_cards(page, search_url, limit, wait_ms)
+            )
+        except (PlaywrightError, OSError) as e:
+            # e.g. Firefox not installed or the profile locked by another process.
+            logger.warning(f"Browser fallback unavailable: {e}")
+            return []
+
+    def _read_cards(
+        self, page: Page, search_url: str, limit: int, wait_ms: int
+    ) -> List[dict]:
+        raw_cards: List[dict] = []
+        page.route("**/*", _block_heavy_resources)
+
+        try:
+            page.goto(search_url, wait_until="domcontentloaded", timeout=30000)
+        except (PlaywrightTimeoutError, PlaywrightError) as e:
+            logger.warning(f"Navigation failed: {e}")
+            return raw_cards
+
+        # Dismiss the "Sign in to view more jobs" modal if it is up. is_visible()
+        # returns immediately, and cards are read from the DOM, so there is no
+        # need to wait for the modal to fade.
+        try:
+            modal_close_btn = page.locator("button.modal__dismiss").first
+            if modal_close_btn.is_visible():
+                modal_close_btn.click()
+        except PlaywrightError:
+            pass  # Modal couldn't be closed
+
+        try:
+            page.wait_for_selector(
+                "ul.jobs-search__results-list > li", timeout=wait_ms
+            )
+            # One round-trip for every field of every card.
+            raw_cards = page.evaluate(
+                EXTRACT_CARDS_JS,
+                ["ul.jobs-search__results-list > li", "div.base-card", limit],
+            )
+            logger.debug(f"Found {len(raw_cards)} cards")
+        except PlaywrightError as e:
+            logger.warning(f"Error reading job cards: {e}")
+            return raw_cards
+
+        if not raw_cards:
             try:
-                for card in cards:
-
-                    if len(results) >= limit:
-                        break
-
-                    title_el = card.query_selector("h3.base-search-card__title")
-                    company_el = card.query_selector(
-                        "h4.base-search-card__subtitle a, h4.base-search-card__subtitle"
-                    )
-                    location_el = card.query_selector("span.job-search-card__location")
-                    link_el = card.query_selector("a.base-card__full-link")
-                    date_el = card.query_selector(
-                        "time.job-search-card__listdate, time.job-search-card__listdate--new"
-                    )
-                    description_el = card.query_selector(
-                        "p.job-search-card__snippet, div.base-search-card__metadata p"
-                    )
-
-                    title = (title_el.inner_text().strip() if title_el else "") or None
-                    company = (company_el.inner_text().strip() if company_el else "") or None
-                    print(f"Company: {company}")
-                    location_text = (
-                        location_el.inner_text().strip() if location_el else ""
-                    ) or None
-                    job_url = (link_el.get_attribute("href") if link_el else "") or None
-                    canonical_url = (
-                        _canonicalize_job_url(job_url) if job_url else None
-                    )
-                    posted_raw = (date_el.get_attribute("datetime") if date_el else None) or (
-                        date_el.inner_text().strip() if date_el else ""
-                    )
-                    description = (
-                        description_el.inner_text().strip() if description_el else None
-                    )
-
-                    job_id = hashlib.md5(canonical_url.encode("utf-8")).hexdigest()
-
-                    date_posted = None
-                    if posted_raw:
-                        try:
-                            date_posted = date.fromisoformat(posted_raw)
-                        except ValueError:
-                            try:
-                                date_posted = datetime.fromisoformat(
-                                    posted_raw.replace("Z", "+00:00")
-                                ).date()
-                            except ValueError:
-                                date_posted = None
-
-                    results.append(
-                        JobListing(
-                            id=job_id,
-                            title=title,
-                            company=company,
-                            job_url=canonical_url,
-                            location=location_text,
-                            description=description,
-                            date_posted=date_posted,
-                        )
-                    )
-            except PlaywrightError as e:
-                print(f"Error scraping job card: {e}")
-                browser.close()
-                return results
-
-            browser.close()
+                path = os.path.abspath("linkedin_scraper_debug.png")
+                page.screenshot(path=path)
+                logger.warning(f"No job cards found. Screenshot saved to: {path}")
+            except Exception as e:
+                logger.warning(f"Error saving screenshot: {e}")
+                pass
 
-        return results
+        return raw_cards
 
 
 if __name__ == "__main__":
     """Test the scraper. Set LINKEDIN_SCRAPER_DEBUG=1 to save a screenshot when no jobs found."""
     from src.utils.storage import JobDatabase
+    logging.basicConfig(level=logging.INFO)
     db = JobDatabase(remote="remote")
     scraper = LinkedInScraper()
     jobs = scraper.search_jobs(
@@ -0,0 +1,50 @@
+"""Content-addressable on-disk cache for structured LLM responses."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "job-orch", "llm")
+
+
+def make_key(*parts: str) -> str:
+    """Hash the given parts into a stable cache key.
+
+    Each part is prefixed with its 8-byte length so that different splits of
+    the same bytes (e.g. model/prompt boundaries) never collide.
+    """
+    h = hashlib.sha256()
+    for part in parts:
+        data = part.encode("utf-8")
+        h.update(len(data).to_bytes(8, "big"))
+        h.update(data)
+    return h.hexdigest()
+
+
+def _path(key: str) -> str:
+    return os.path.join(CACHE_DIR, f"{key}.json")
+
+
+def get(key: str) -> Optional[dict]:
+    """Return the cached payload for key, or None on a miss."""
+    try:
+        with open(_path(key), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def put(key: str, obj: BaseModel) -> None:
+    """Store a pydantic model under key."""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = _path(key)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(obj.model_dump(mode="json"), f)
+    os.replace(tmp_path, path)
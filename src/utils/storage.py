@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import date, datetime
+from itertools import islice
 import os
 import sqlite3
-import pandas as pd
-from typing import List
+from typing import TYPE_CHECKING, Iterator, List
 
 from src.schema.job import JobListing
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+INSERT_CHUNK_SIZE = 1000
+SCHEMA_VERSION = 1
+
 
 @dataclass
 class JobDatabase:
@@ -23,7 +31,15 @@ class JobDatabase:
         db_dir = os.path.dirname(self.db_path)
         if db_dir:
             os.makedirs(db_dir, exist_ok=True)
-        self._conn = sqlite3.connect(self.db_path)
+        # Autocommit mode: writes are grouped explicitly via _transaction().
+        self._conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA mmap_size=268435456")
+        self._conn.execute("PRAGMA cache_size=-65536")
         self._conn.execute(
             """
             CREATE TABLE IF NOT EXISTS jobs (
@@ -39,55 +55,93 @@ class JobDatabase:
             )
             """
         )
-        # Clean exact URL duplicates and ensure a unique index exists.
-        self._conn.execute(
-            """
-            DELETE FROM jobs
-            WHERE rowid NOT IN (
-                SELECT MIN(rowid) FROM jobs GROUP BY url
-            )
-            """
-        )
-        self._conn.execute(
-            "CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_url ON jobs(url)"
-        )
-        self._conn.commit()
+        self.migrate()
+
+    def migrate(self) -> None:
+        """Bring an existing DB up to SCHEMA_VERSION; a no-op once it is current."""
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
+
+        with self._transaction():
+            if version < 1:
+                # Clean exact URL duplicates and ensure a unique index exists.
+                self._conn.execute(
+                    """
+                    DELETE FROM jobs
+                    WHERE rowid IN (
+                        SELECT rowid FROM (
+                            SELECT rowid, ROW_NUMBER() OVER (
+                                PARTITION BY url ORDER BY rowid
+                            ) AS rn
+                            FROM jobs
+                        )
+                        WHERE rn > 1
+                    )
+                    """
+                )
+                self._conn.execute(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_url ON jobs(url)"
+                )
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def __enter__(self) -> JobDatabase:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        self._conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Run the enclosed statements in a single write transaction."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
 
     def add_jobs(self, jobs: List[JobListing]) -> int:
         """Insert jobs into the DB. Returns number of newly inserted rows."""
         if not jobs:
             return 0
 
-        rows = []
-        for job in jobs:
-            if isinstance(job.date_posted, datetime):
-                date_posted = job.date_posted.date().isoformat()
-            elif isinstance(job.date_posted, date):
-                date_posted = job.date_posted.isoformat()
-            else:
+        def rows() -> Iterator[tuple]:
+            for job in jobs:
                 date_posted = job.date_posted
-            rows.append(
-                (
+                if isinstance(date_posted, datetime):
+                    date_posted = date_posted.date()
+                yield (
                     job.id,
                     job.job_url,
                     job.title,
                     job.company,
-                    date_posted,
+                    date_posted.isoformat()
+                    if isinstance(date_posted, date)
+                    else date_posted,
                     job.location,
                     self.remote,
                 )
-            )
 
+        # Stream rows in bounded chunks, one transaction each, so large imports
+        # never materialize every row at once.
         before = self._conn.total_changes
-        self._conn.executemany(
-            """
-            INSERT OR IGNORE INTO jobs (
-                id, url, title, company, date_posted, location, remote
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            rows,
-        )
-        self._conn.commit()
+        row_iter = rows()
+        while chunk := list(islice(row_iter, INSERT_CHUNK_SIZE)):
+            with self._transaction():
+                self._conn.executemany(
+                    """
+                    INSERT OR IGNORE INTO jobs (
+                        id, url, title, company, date_posted, location, remote
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    chunk,
+                )
         return self._conn.total_changes - before
 
     def get_new_jobs(self, urls: List[str]) -> List[str]:
@@ -95,13 +149,47 @@ class JobDatabase:
         if not urls:
             return []
 
-        placeholders = ",".join("?" for _ in urls)
-        query = f"SELECT url FROM jobs WHERE url IN ({placeholders})"
-        existing = {row[0] for row in self._conn.execute(query, urls).fetchall()}
-        return [url for url in urls if url not in existing]
+        # Probe through a temp table rather than a giant IN (...) list so the
+        # lookup is one indexed anti-join with no bound-parameter limit.
+        self._conn.execute("SAVEPOINT get_new_jobs")
+        try:
+            self._conn.execute(
+                """
+                CREATE TEMP TABLE IF NOT EXISTS _urls_probe (
+                    url TEXT PRIMARY KEY
+                ) WITHOUT ROWID
+                """
+            )
+            self._conn.execute("DELETE FROM _urls_probe")
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO _urls_probe (url) VALUES (?)",
+                ((url,) for url in urls),
+            )
+            new = {
+                row[0]
+                for row in self._conn.execute(
+                    """
+                    SELECT p.url FROM _urls_probe p
+                    LEFT JOIN jobs j ON j.url = p.url
+                    WHERE j.url IS NULL
+                    """
+                )
+            }
+        finally:
+            self._conn.execute("RELEASE get_new_jobs")
+        return [url for url in urls if url in new]
 
     def db_to_df(self) -> pd.DataFrame:
         """Return the DB as a pandas DataFrame."""
-        df = pd.read_sql_query("SELECT * FROM jobs", self._conn)
-        df.drop(columns=["id"], inplace=True)
-        return df
\ No newline at end of file
+        import pandas as pd
+
+        cursor = self._conn.execute(
+            """
+            SELECT url, title, company, date_posted, location, remote, status,
+                relevance_score
+            FROM jobs
+            """
+        )
+        return pd.DataFrame.from_records(
+            cursor.fetchall(), columns=[col[0] for col in cursor.description]
+        )
\ No newline at end of file